@@ -1,3 +1,4 @@
+import functools
 import os
 from dotenv import load_dotenv
 import boto3
@@ -14,26 +15,49 @@ AWS_DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION')
 READ_TIMEOUT = int(os.getenv('AWS_READ_TIMEOUT', '240'))
 CONNECT_TIMEOUT = int(os.getenv('AWS_CONNECT_TIMEOUT', '120'))
 MAX_RETRIES = int(os.getenv('AWS_MAX_RETRIES', '5'))
+MAX_CONCURRENCY = int(os.getenv('S3_MAX_CONCURRENCY', '10'))
+PREFETCH_WORKERS = int(os.getenv('S3_PREFETCH_WORKERS', '4'))
+
+# Optionally enlarge http.client's 8 KB connection buffer to 1 MB.
+# Tiny buffers mean tiny syscalls, which caps throughput under
+# multi-threaded multipart downloads; enable with S3_BIG_HTTP_BUFFER=1.
+if os.getenv('S3_BIG_HTTP_BUFFER') == '1':
+    from http.client import HTTPConnection
+    HTTPConnection.__init__.__defaults__ = tuple(
+        1024 * 1024 if x == 8192 else x for x in HTTPConnection.__init__.__defaults__
+    )
 
 # Configure the client with timeouts and retry settings
 my_config = Config(
     read_timeout=READ_TIMEOUT,
     connect_timeout=CONNECT_TIMEOUT,
-    retries={'max_attempts': MAX_RETRIES}
+    retries={'max_attempts': MAX_RETRIES},
+    # Keep the pool ahead of the worst case: PREFETCH_WORKERS concurrent
+    # downloads each running MAX_CONCURRENCY streams, otherwise transfers
+    # serialize on connection checkout with "Connection pool is full"
+    # warnings
+    max_pool_connections=max(32, MAX_CONCURRENCY * PREFETCH_WORKERS)
 )
 
-# Create S3 client
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=AWS_DEFAULT_REGION,
-    config=my_config
-)
+# Create the S3 client on first use; building it at import time would put
+# credential resolution (and, with the old smoke test, a network RTT) on
+# every ComfyUI startup
+@functools.lru_cache(maxsize=None)
+def get_s3_client():
+    return boto3.client(
+        's3',
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_DEFAULT_REGION,
+        config=my_config
+    )
 
 def test():
     # List S3 buckets
-    response = s3_client.list_buckets()
+    response = get_s3_client().list_buckets()
     print("S3 bucket access success")
 
-test()
+# opt-in startup check; the unconditional call added a blocking RTT (or a
+# hang on IAM misconfiguration) to every launch
+if os.getenv('S3_SMOKE_TEST') == '1':
+    test()
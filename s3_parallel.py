@@ -0,0 +1,85 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import boto3
+
+from .s3_manager import AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_DEFAULT_REGION, my_config
+
+MULTIPROCESS_WORKERS = int(os.getenv('S3_MULTIPROCESS_WORKERS', str(min(os.cpu_count() or 4, 8))))
+
+# Per-process client; boto3 clients are not fork-safe, so each worker
+# constructs its own in the pool initializer.
+_worker_client = None
+
+def _init_worker():
+    global _worker_client
+    _worker_client = boto3.client(
+        's3',
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_DEFAULT_REGION,
+        config=my_config
+    )
+
+def _fetch_range(bucket_name: str, object_key: str, save_path: str, offset: int, length: int) -> int:
+    """
+    Downloads one byte range and pwrites it into save_path at its offset.
+    Runs inside a worker process; returns the number of bytes written.
+    """
+    response = _worker_client.get_object(
+        Bucket=bucket_name, Key=object_key,
+        Range=f"bytes={offset}-{offset + length - 1}"
+    )
+    body = response['Body']
+    fd = os.open(save_path, os.O_WRONLY)
+    try:
+        written = 0
+        while True:
+            chunk = body.read(1024 * 1024)
+            if not chunk:
+                break
+            os.pwrite(fd, chunk, offset + written)
+            written += len(chunk)
+    finally:
+        os.close(fd)
+    return written
+
+def download_file_parallel(bucket_name: str, object_key: str, save_path: str,
+                           file_size: int, chunksize: int, callback=None) -> None:
+    """
+    Downloads an object by splitting it into chunksize byte ranges fetched
+    by worker processes. Each worker owns its own S3 client and writes its
+    range directly to the destination file, so no data passes through the
+    parent. The file is sized up-front so the pwrites land in place;
+    save_path must therefore be a temp name the caller renames into place
+    afterwards — a preallocated file at the final path would pass for a
+    complete, zero-filled LoRA if the download is interrupted.
+    """
+    fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # reserve the extents up front where the filesystem supports it
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, file_size)
+            except OSError:
+                os.truncate(fd, file_size)
+        else:
+            os.truncate(fd, file_size)
+    finally:
+        os.close(fd)
+    ranges = [(offset, min(chunksize, file_size - offset))
+              for offset in range(0, file_size, chunksize)]
+    with ProcessPoolExecutor(max_workers=MULTIPROCESS_WORKERS, initializer=_init_worker) as pool:
+        futures = [pool.submit(_fetch_range, bucket_name, object_key, save_path, offset, length)
+                   for offset, length in ranges]
+        try:
+            for future in as_completed(futures):
+                written = future.result()
+                if callback is not None:
+                    callback(written)
+        except BaseException:
+            # first failed range aborts the download: drop the queued
+            # ranges instead of letting the pool drain them pointlessly
+            for future in futures:
+                future.cancel()
+            raise
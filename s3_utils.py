@@ -1,58 +1,368 @@
+import re
 import sys
+import threading
 import time
-from typing import Tuple
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Tuple
 import folder_paths
-import boto3
-from boto3.s3.transfer import TransferConfig
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.exceptions import ClientError
+from s3transfer.subscribers import BaseSubscriber
 import comfy.sd
 import comfy.utils
 import logging
 import os
 
-from .s3_manager import s3_client
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    from safetensors import safe_open
+except ImportError:
+    safe_open = None
+
+try:
+    # boto3 refuses preferred_transfer_client='crt' with a
+    # MissingDependencyException unless awscrt is at least 0.19.18, so
+    # gate on the same version check boto3 itself applies
+    from boto3.s3.transfer import has_minimum_crt_version
+    _HAS_CRT = has_minimum_crt_version((0, 19, 18))
+except ImportError:
+    _HAS_CRT = False
+
+from .s3_manager import MAX_CONCURRENCY, PREFETCH_WORKERS, get_s3_client
+from .s3_parallel import download_file_parallel
 from .autonode import node_wrapper, validate, get_node_names_mappings
 
 logger = logging.getLogger("s3_utils")
 
-s3_client: boto3.client = s3_client
+# Transfer tuning (optional, via environment variables)
+MULTIPART_THRESHOLD = int(os.getenv('S3_MULTIPART_THRESHOLD', str(8 * 1024 * 1024)))
+MULTIPART_CHUNKSIZE = int(os.getenv('S3_MULTIPART_CHUNKSIZE', str(8 * 1024 * 1024)))
+# MAX_CONCURRENCY comes from s3_manager so the client's connection pool
+# is always sized against the same S3_MAX_CONCURRENCY value; on slow or
+# unreliable links set it to 1 to avoid competing streams
+
+# Shared transfer config; built once so every download reuses the same tuning
+TRANSFER_CFG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    max_concurrency=MAX_CONCURRENCY,
+    multipart_chunksize=MULTIPART_CHUNKSIZE,
+    # larger write buffers keep the disk writer from becoming the bottleneck
+    io_chunksize=1024 * 1024,
+    max_io_queue=2000,
+    use_threads=True
+)
+
+# Pick the transfer client explicitly: boto3's default 'auto' only uses
+# CRT on instance types awscrt reports as optimized, so request 'crt'
+# outright whenever a compatible awscrt is installed — that's the manager
+# doing the parallel range GETs in native code instead of Python threads.
+# S3_USE_CRT=0 forces 'classic' so the opt-out also works on
+# CRT-optimized hosts. Harmless on boto3 versions without CRT support.
+if _HAS_CRT and os.getenv('S3_USE_CRT', '1') == '1':
+    TRANSFER_CFG.preferred_transfer_client = 'crt'
+else:
+    TRANSFER_CFG.preferred_transfer_client = 'classic'
 
 class ProgressPercentage:
-    def __init__(self, file_size):
-        self._file_size = file_size
+    # s3transfer fires the callback per 256 KB chunk; rendering every one
+    # (formatting + flushed write) measurably slows downloads, so only
+    # render every _RENDER_INTERVAL seconds and on completion.
+    _RENDER_INTERVAL = 0.25
+    _TEMPLATE = "\rDownloading... {} | Speed: {:.2f} bytes/s | Elapsed: {:.2f}s"
+
+    def __init__(self, file_size=None):
+        self._file_size = None
+        self._inv_size = None
+        if file_size:
+            self.set_file_size(file_size)
         self._seen_so_far = 0
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
+        self._last_render = 0.0
+        self._last_seen = 0
+        self._ema_speed = 0.0
+        self._is_tty = sys.stdout.isatty()
+        self._render_lock = threading.Lock()
+
+    def set_file_size(self, file_size):
+        self._file_size = file_size
+        self._inv_size = 1.0 / file_size if file_size else None
 
     def __call__(self, bytes_amount):
+        # s3transfer invokes this from multiple worker threads; the
+        # unlocked += is a load/add/store sequence that can lose updates
+        # under contention, which is acceptable for a display counter —
+        # the authoritative final line comes from finish() once the
+        # transfer completes, not from the count reaching the total.
         self._seen_so_far += bytes_amount
-        elapsed_time = time.time() - self._start_time
-        percentage = (self._seen_so_far / self._file_size) * 100
-        speed = self._seen_so_far / elapsed_time if elapsed_time > 0 else 0
-        sys.stdout.write(
-            f"\rDownloading... {self._seen_so_far}/{self._file_size} bytes "
-            f"({percentage:.2f}%) | Speed: {speed:.2f} bytes/s | Elapsed: {elapsed_time:.2f}s"
+        now = time.monotonic()
+        if now - self._last_render < self._RENDER_INTERVAL:
+            return
+        # Only the rendering branch takes the lock; workers that lose the
+        # race skip the render instead of queueing behind stdout.
+        if self._render_lock.acquire(blocking=False):
+            try:
+                self._render(now)
+            finally:
+                self._render_lock.release()
+
+    def finish(self):
+        # unconditional closing render once the transfer is complete
+        with self._render_lock:
+            self._render(time.monotonic())
+
+    def _render(self, now):
+        elapsed_time = now - self._start_time
+        interval = now - self._last_render if self._last_render else elapsed_time
+        instant_speed = (self._seen_so_far - self._last_seen) / interval if interval > 0 else 0.0
+        # EMA keeps the displayed speed from jittering chunk to chunk
+        self._ema_speed = instant_speed if self._ema_speed == 0.0 else 0.9 * self._ema_speed + 0.1 * instant_speed
+        self._last_render = now
+        self._last_seen = self._seen_so_far
+        if self._inv_size is not None:
+            percentage = self._seen_so_far * self._inv_size * 100
+            progress = f"{self._seen_so_far}/{self._file_size} bytes ({percentage:.2f}%)"
+        else:
+            progress = f"{self._seen_so_far} bytes"
+        sys.stdout.write(self._TEMPLATE.format(progress, self._ema_speed, elapsed_time))
+        if self._is_tty:
+            sys.stdout.flush()
+
+class ProgressSubscriber(BaseSubscriber):
+    """
+    Feeds ProgressPercentage from the transfer manager's own callbacks.
+    The manager already HEADs the object internally, so the total size is
+    picked up from future.meta.size instead of a separate head_object call.
+    """
+    def __init__(self, preallocate_fd=None):
+        self._progress = ProgressPercentage()
+        self._preallocate_fd = preallocate_fd
+
+    def on_progress(self, future, bytes_transferred, **kwargs):
+        if self._progress._file_size is None:
+            # CRT transfer futures carry no size on their meta; render
+            # byte counts without totals and skip preallocation then
+            file_size = getattr(future.meta, 'size', None)
+            if file_size:
+                self._progress.set_file_size(file_size)
+                if self._preallocate_fd is not None and hasattr(os, 'posix_fallocate'):
+                    # reserve the extents in one go instead of growing the
+                    # file write by write. The fd must point at the .part
+                    # temp file, never the final path: preallocating in
+                    # place would make an interrupted download look like a
+                    # complete, zero-filled LoRA
+                    try:
+                        os.posix_fallocate(self._preallocate_fd, 0, file_size)
+                    except OSError:
+                        pass  # not every filesystem supports fallocate
+        self._progress(bytes_transferred)
+
+    def on_done(self, future, **kwargs):
+        self._progress.finish()
+
+# One long-lived transfer manager for all downloads: its worker threads
+# are started once instead of per call, and concurrent LoRA fetches share
+# a single bounded pool instead of each spinning up their own
+_TM_LOCK = threading.Lock()
+_TM = None
+
+def _get_transfer_manager():
+    global _TM
+    with _TM_LOCK:
+        if _TM is None:
+            try:
+                _TM = create_transfer_manager(get_s3_client(), TRANSFER_CFG)
+            except Exception as e:
+                # e.g. MissingDependencyException when 'crt' was requested
+                # but boto3 deems the installed awscrt unusable; a broken
+                # CRT setup must degrade, not take every download down
+                logger.warning(f"CRT transfer manager unavailable, using classic: {e}")
+                TRANSFER_CFG.preferred_transfer_client = 'classic'
+                _TM = create_transfer_manager(get_s3_client(), TRANSFER_CFG)
+        return _TM
+
+# hf_transfer only pays off on large objects; below this the extra HEAD
+# and process overhead outweigh the native range GETs
+HF_TRANSFER_MIN_SIZE = int(os.getenv('S3_HF_TRANSFER_MIN_SIZE', str(500 * 1024 * 1024)))
+
+def _try_hf_transfer(bucket_name: str, object_key: str, save_path: str) -> bool:
+    """
+    Attempts the download with hf_transfer's Rust multipart puller through
+    a presigned URL. Returns False (meaning: fall back to boto3) when the
+    package is missing, the object is below the size floor, or anything in
+    the native path fails.
+    """
+    try:
+        import hf_transfer
+    except ImportError:
+        return False
+    try:
+        client = get_s3_client()
+        file_size = client.head_object(Bucket=bucket_name, Key=object_key)['ContentLength']
+        if file_size < HF_TRANSFER_MIN_SIZE:
+            return False
+        url = client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': bucket_name, 'Key': object_key},
+            ExpiresIn=3600
+        )
+        progress = ProgressPercentage(file_size)
+        hf_transfer.download(
+            url=url, filename=save_path,
+            max_files=16, chunk_size=10 * 1024 * 1024,
+            callback=progress
         )
-        sys.stdout.flush()
+        progress.finish()
+        return True
+    except Exception as e:
+        logger.warning(f"hf_transfer download failed, falling back to boto3: {e}")
+        return False
+
+# Missing objects are remembered for a short window so a misconfigured
+# key doesn't pay an RTT plus the full retry/backoff cycle (and spam the
+# log) on every render
+NEGATIVE_CACHE_TTL = float(os.getenv('S3_NEGATIVE_CACHE_TTL', '60'))
+NEGATIVE_CACHE_MAX = 1024
+_NEGATIVE_CACHE: Dict[Tuple[str, str], float] = {}
+_NEGATIVE_CACHE_LOCK = threading.Lock()
+
+def _negative_cached(bucket_name: str, object_key: str) -> bool:
+    key = (bucket_name, object_key)
+    with _NEGATIVE_CACHE_LOCK:
+        expiry = _NEGATIVE_CACHE.get(key)
+        if expiry is None:
+            return False
+        if time.monotonic() >= expiry:
+            del _NEGATIVE_CACHE[key]
+            return False
+        return True
+
+def _record_negative(bucket_name: str, object_key: str) -> None:
+    now = time.monotonic()
+    with _NEGATIVE_CACHE_LOCK:
+        if len(_NEGATIVE_CACHE) >= NEGATIVE_CACHE_MAX:
+            # sweep expired entries, then drop the oldest (insertion order
+            # tracks expiry order) until back under the cap
+            for key in [k for k, expiry in _NEGATIVE_CACHE.items() if expiry <= now]:
+                del _NEGATIVE_CACHE[key]
+            while len(_NEGATIVE_CACHE) >= NEGATIVE_CACHE_MAX:
+                del _NEGATIVE_CACHE[next(iter(_NEGATIVE_CACHE))]
+        _NEGATIVE_CACHE[(bucket_name, object_key)] = now + NEGATIVE_CACHE_TTL
 
 def get_lora_from_s3(bucket_name: str, object_key: str, save_path: str) -> bool:
+    if _negative_cached(bucket_name, object_key):
+        return False
     try:
         logger.info(f"Fetching LoRA from S3: {bucket_name}/{object_key} to {save_path}")
 
-        response = s3_client.head_object(Bucket=bucket_name, Key=object_key)
-        file_size = response['ContentLength']
-        config = TransferConfig(multipart_threshold=1024 * 25, max_concurrency=10, multipart_chunksize=1024 * 25)
         start_time = time.time()
-        s3_client.download_file(
-            bucket_name, object_key, save_path,
-            Config=config,
-            Callback=ProgressPercentage(file_size)
-        )
+        # Every branch downloads to a temp name and publishes with an
+        # atomic rename, so a half-written file is never visible at
+        # save_path — not even after a SIGKILL or power loss mid-transfer
+        part_path = save_path + '.part'
+        try:
+            if os.getenv('S3_USE_HF_TRANSFER') == '1' and _try_hf_transfer(bucket_name, object_key, part_path):
+                pass
+            elif os.getenv('S3_USE_MULTIPROCESS') == '1':
+                # Sidesteps the GIL around SSL decrypt on fast links.
+                # This path keeps its HEAD since the byte ranges need the size up front.
+                response = get_s3_client().head_object(Bucket=bucket_name, Key=object_key)
+                file_size = response['ContentLength']
+                progress = ProgressPercentage(file_size)
+                download_file_parallel(
+                    bucket_name, object_key, part_path,
+                    file_size, MULTIPART_CHUNKSIZE,
+                    callback=progress
+                )
+                progress.finish()
+            else:
+                # writing through our own fd lets the subscriber preallocate
+                # the full file once the transfer manager learns the size
+                fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                with os.fdopen(fd, 'wb') as f:
+                    _get_transfer_manager().download(
+                        bucket_name, object_key, f,
+                        subscribers=[ProgressSubscriber(preallocate_fd=fd)]
+                    ).result()
+            os.replace(part_path, save_path)
+        except Exception:
+            # don't leave the temp file behind either
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            raise
         elapsed_time = time.time() - start_time
         logger.info(f"Successfully saved LoRA file to {save_path} in {elapsed_time:.2f} seconds.")
         return True
+    except ClientError as e:
+        # remember definite misses; callers within the TTL short-circuit
+        # before this log line, so each miss is reported once per window
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NoSuchBucket'):
+            _record_negative(bucket_name, object_key)
+        logger.error(f"Error fetching LoRA from S3: {e}")
+        return False
     except Exception as e:
         logger.error(f"Error fetching LoRA from S3: {e}")
         return False
 
+# Per-directory file listings keyed by directory path, rebuilt only when
+# the directory's mtime changes. A lookup costs one stat of the directory
+# plus a set membership test instead of a stat per candidate file, which
+# matters on cold NFS caches where every stat is a round-trip.
+_folder_index: Dict[str, Tuple[float, set]] = {}
+_folder_index_lock = threading.Lock()
+_EMPTY_SET: set = set()
+
+def _dir_entries(dirname: str) -> set:
+    try:
+        mtime = os.stat(dirname).st_mtime
+    except OSError:
+        return _EMPTY_SET
+    with _folder_index_lock:
+        cached = _folder_index.get(dirname)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    entries = set()
+    try:
+        with os.scandir(dirname) as it:
+            for entry in it:
+                try:
+                    if entry.is_file(follow_symlinks=True):
+                        entries.add(entry.name)
+                    elif entry.is_symlink():
+                        logging.warning("WARNING path {} exists but doesn't link anywhere, skipping.".format(entry.path))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    with _folder_index_lock:
+        _folder_index[dirname] = (mtime, entries)
+    return entries
+
+def _resolve(folder_name: str, filename: str) -> Tuple[str, bool]:
+    """
+    Walks the candidate folders for filename using the directory index,
+    so repeated lookups don't re-stat every folder. New files (including
+    freshly downloaded ones) are picked up via the directory mtime.
+    """
+    folders = folder_paths.folder_names_and_paths[folder_name]
+    sep = os.sep
+    for x in folders[0]:
+        # filename is validated and relative, so skip the general joiner
+        full_path = x + filename if x.endswith(sep) else x + sep + filename
+        dirname, basename = os.path.split(full_path)
+        if basename in _dir_entries(dirname):
+            return full_path, True
+    # fallback to first folder
+    first = folders[0][0]
+    return (first + filename if first.endswith(sep) else first + sep + filename), False
+
 def get_full_path_simulate(folder_name: str, filename: str) -> Tuple[str, bool]:
     """
     Simulates the full path of the file if it exists.
@@ -64,45 +374,170 @@ def get_full_path_simulate(folder_name: str, filename: str) -> Tuple[str, bool]:
     folder_name = folder_paths.map_legacy(folder_name)
     if folder_name not in folder_paths.folder_names_and_paths:
         raise FileNotFoundError(f"Folder '{folder_name}' not found in folder_names_and_paths.")
-    folders = folder_paths.folder_names_and_paths[folder_name]
-    filename = os.path.relpath(os.path.join("/", filename), "/")
-    for x in folders[0]:
-        full_path = os.path.join(x, filename)
-        if os.path.isfile(full_path):
-            return full_path, True
-        elif os.path.islink(full_path):
-            logging.warning("WARNING path {} exists but doesn't link anywhere, skipping.".format(full_path))
-    # fallback to first folder
-    full_path = os.path.join(folders[0][0], filename)
-    if not os.path.isfile(full_path):
-        return full_path, False
-    raise RuntimeError(f"This condition should never be reached, {full_path} exists but is not a file.")
+    # the join/relpath round-trip only stripped leading separators
+    filename = filename.lstrip('/').lstrip('\\')
+    return _resolve(folder_name, filename)
+
+# Background downloads so the S3 fetch can overlap model/clip preparation;
+# in-flight futures are shared so a prefetch and the actual load don't
+# download the same object twice. S3_PREFETCH_WORKERS (default 4) sizes
+# the pool — raise it for workflows that batch-fetch many small LoRAs;
+# the client connection pool in s3_manager is sized to match.
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix="s3-prefetch")
+_PREFETCH_FUTURES: "Dict[Tuple[str, str, str], Future]" = {}
+_PREFETCH_LOCK = threading.Lock()
+
+def _evict_prefetch(key: Tuple[str, str, str], future: Future) -> None:
+    # completed transfers leave the map so it only ever dedupes downloads
+    # that are actually in flight; a fresh call re-checks the disk
+    with _PREFETCH_LOCK:
+        if _PREFETCH_FUTURES.get(key) is future:
+            del _PREFETCH_FUTURES[key]
 
-def get_full_path_or_raise(folder_name: str, filename: str, bucket_name: str, object_key: str) -> str: 
+def prefetch_lora(bucket_name: str, object_key: str, save_path: str) -> Future:
+    """
+    Starts fetching the object in the background and returns a Future
+    resolving to the same bool as get_lora_from_s3. Repeated calls for the
+    same (bucket, key, path) join the in-flight download; the entry is
+    evicted once the transfer finishes, so later calls fetch again.
+
+    Prefetching concurrently with execution is only safe because
+    get_lora_from_s3 publishes atomically: while a transfer is in flight
+    nothing exists at save_path, so path lookups keep reporting the file
+    missing and consumers end up here, joining the in-flight future,
+    instead of reading a half-written file.
+    """
+    key = (bucket_name, object_key, save_path)
+    with _PREFETCH_LOCK:
+        future = _PREFETCH_FUTURES.get(key)
+        if future is not None:
+            return future
+        future = _PREFETCH_POOL.submit(get_lora_from_s3, bucket_name, object_key, save_path)
+        _PREFETCH_FUTURES[key] = future
+    # registered outside the lock: a future that finishes immediately runs
+    # the callback inline, which takes the (non-reentrant) lock itself
+    future.add_done_callback(lambda fut, key=key: _evict_prefetch(key, fut))
+    return future
+
+def get_loras_from_s3(items: List[Tuple[str, str, str]]) -> List[bool]:
+    """
+    Fetches several (bucket_name, object_key, save_path) objects at once
+    through the prefetch pool, so workflows referencing many small LoRAs
+    don't serialize one TLS handshake and transfer after another.
+    Returns the per-item success flags in input order. Exposed in the UI
+    via the LoraPrefetchS3 node; size the pool with S3_PREFETCH_WORKERS.
+    """
+    futures = [prefetch_lora(bucket_name, object_key, save_path)
+               for bucket_name, object_key, save_path in items]
+    return [future.result() for future in futures]
+
+def get_full_path_or_raise(folder_name: str, filename: str, bucket_name: str, object_key: str) -> str:
     """
     Fetches the full path of the file if it exists, otherwise fetches the file from S3.
     """
     full_path, exists = get_full_path_simulate(folder_name, filename)
     if not exists:
-        if not get_lora_from_s3(bucket_name, object_key, full_path):
+        if not prefetch_lora(bucket_name, object_key, full_path).result():
             raise FileNotFoundError(f"Failed to fetch LoRA from S3: {bucket_name}/{object_key}")
         return full_path
     return full_path
 
+# Parent references, home expansion, NUL bytes and absolute paths are all
+# rejected; compiled once so bulk listings pay a single scan per name
+_UNSAFE_PATH_RE = re.compile(r"\.\.|~|\x00|^[/\\]")
+
 def ensure_path_safety(path: str) -> str:
-    # Ensure path is safe, .. and ~ are not allowed
-    if ".." in path or "~" in path:
+    # Ensure path is safe, .., ~, NUL and absolute paths are not allowed
+    if _UNSAFE_PATH_RE.search(path):
         raise ValueError(f"Path '{path}' is not safe.")
     return path
 
+class _LazySafetensorsDict(Mapping):
+    """
+    Read-only state dict over an mmap-backed safetensors file that
+    materializes tensors on first access, so keys the model never touches
+    never hit RAM. Keeps the safe_open handle alive for its own lifetime.
+    """
+    def __init__(self, lora_path: str):
+        self._handle = safe_open(lora_path, framework='pt', device='cpu')
+        self._keys = list(self._handle.keys())
+        self._tensors = {}
+        self.nbytes = os.path.getsize(lora_path)
+
+    def __getitem__(self, key):
+        tensor = self._tensors.get(key)
+        if tensor is None:
+            tensor = self._handle.get_tensor(key)
+            self._tensors[key] = tensor
+        return tensor
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+def _load_lora_file(lora_path: str):
+    if safe_open is not None and lora_path.endswith('.safetensors'):
+        return _LazySafetensorsDict(lora_path)
+    if lora_path.endswith('.ckpt'):
+        try:
+            import torch
+            return torch.load(lora_path, map_location='cpu', mmap=True, weights_only=True)
+        except TypeError:
+            # mmap needs PyTorch 2.1+, fall through to the standard loader
+            pass
+    return comfy.utils.load_torch_file(lora_path, safe_load=True)
+
+# Pinned LoRA state dicts, shared by every loader node so workflows that
+# rotate between a few LoRAs don't reload them from disk on each switch
+LORA_PIN_COUNT = int(os.getenv('S3_LORA_PIN_COUNT', '4'))
+LORA_PIN_BYTES = int(os.getenv('S3_LORA_PIN_BYTES', str(4 * 1024 * 1024 * 1024)))
+
+_LORA_CACHE: "OrderedDict[Tuple[int, int, int], Tuple[dict, int]]" = OrderedDict()
+_LORA_CACHE_LOCK = threading.Lock()
+
+def _file_identity(lora_path: str) -> Tuple[int, int, int]:
+    # Cache key that survives renames: hardlinked or renamed copies of the
+    # same file share (st_dev, st_ino), and an overwrite bumps st_mtime_ns,
+    # so the same object under a new filename still hits while stale
+    # tensors for a replaced file miss. One os.stat per lookup.
+    st = os.stat(lora_path)
+    return (st.st_dev, st.st_ino, st.st_mtime_ns)
+
+def _lora_nbytes(lora) -> int:
+    if isinstance(lora, _LazySafetensorsDict):
+        # use the file size; iterating values() would materialize every tensor
+        return lora.nbytes
+    return sum(t.numel() * t.element_size() for t in lora.values() if hasattr(t, 'numel'))
+
+def _get_cached_lora(identity: Tuple[int, int, int]):
+    with _LORA_CACHE_LOCK:
+        entry = _LORA_CACHE.get(identity)
+        if entry is None:
+            return None
+        _LORA_CACHE.move_to_end(identity)
+        return entry[0]
+
+def _cache_lora(identity: Tuple[int, int, int], lora) -> None:
+    nbytes = _lora_nbytes(lora)
+    if psutil is not None and nbytes > psutil.virtual_memory().available:
+        # don't pin what no longer fits in free RAM
+        return
+    with _LORA_CACHE_LOCK:
+        _LORA_CACHE[identity] = (lora, nbytes)
+        _LORA_CACHE.move_to_end(identity)
+        while len(_LORA_CACHE) > 1 and (
+            len(_LORA_CACHE) > LORA_PIN_COUNT
+            or sum(entry[1] for entry in _LORA_CACHE.values()) > LORA_PIN_BYTES
+        ):
+            _LORA_CACHE.popitem(last=False)
+
 classes = []
 wrapper = node_wrapper(classes)
 
 @wrapper
 class LoraLoaderFallbackS3:
-    def __init__(self):
-        self.loaded_lora = None
-
     @classmethod
     def INPUT_TYPES(s):
         return {
@@ -117,6 +552,23 @@ class LoraLoaderFallbackS3:
             }
         }
     
+    @classmethod
+    def VALIDATE_INPUTS(cls, lora_name, bucket_name, object_key):
+        # Kick off the S3 fetch as soon as the inputs are known so the
+        # download overlaps graph validation and model/clip preparation;
+        # load_lora joins the same future at actual use. The file only
+        # appears at full_path once the download has published atomically,
+        # so a mid-flight prefetch can never hand load_lora a partial file.
+        if bucket_name and object_key:
+            try:
+                full_path, exists = get_full_path_simulate("loras", lora_name)
+                if not exists:
+                    prefetch_lora(bucket_name, object_key, full_path)
+            except Exception as e:
+                # the real load surfaces errors; validation shouldn't fail the graph
+                logger.debug(f"Prefetch skipped for {bucket_name}/{object_key}: {e}")
+        return True
+
     RETURN_TYPES = ("MODEL", "CLIP")
     OUTPUT_TOOLTIPS = ("The modified diffusion model.", "The modified CLIP model.")
     FUNCTION = "load_lora"
@@ -129,18 +581,11 @@ class LoraLoaderFallbackS3:
             return (model, clip)
 
         lora_path = get_full_path_or_raise("loras", lora_name, bucket_name, object_key)
-        lora = None
-        if self.loaded_lora is not None:
-            if self.loaded_lora[0] == lora_path:
-                lora = self.loaded_lora[1]
-            else:
-                temp = self.loaded_lora
-                self.loaded_lora = None
-                del temp
-
+        identity = _file_identity(lora_path)
+        lora = _get_cached_lora(identity)
         if lora is None:
-            lora = comfy.utils.load_torch_file(lora_path, safe_load=True)
-            self.loaded_lora = (lora_path, lora)
+            lora = _load_lora_file(lora_path)
+            _cache_lora(identity, lora)
 
         model_lora, clip_lora = comfy.sd.load_lora_for_models(model, clip, lora, strength_model, strength_clip)
         return (model_lora, clip_lora)
@@ -161,5 +606,41 @@ class LoraLoaderModelOnlyFallbackS3(LoraLoaderFallbackS3):
     def load_lora_model_only(self, model, lora_name, strength_model, bucket_name, object_key):
         return (self.load_lora(model, None, lora_name, strength_model, 0, bucket_name, object_key)[0],)
 
+@wrapper
+class LoraPrefetchS3:
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "lora_list": ("STRING", {"default": "", "multiline": True, "tooltip": "One LoRA per line: lora_name, bucket_name, object_key"}),
+            }
+        }
+
+    RETURN_TYPES = ("STRING",)
+    OUTPUT_TOOLTIPS = ("The fetched LoRA names, one per line.",)
+    FUNCTION = "prefetch"
+    CATEGORY = "loaders"
+    DESCRIPTION = "Fetches several LoRAs from S3 at once. The listed objects download concurrently instead of one after another, so workflows that rotate through many small LoRAs have them all on disk before the loader nodes run."
+    custom_name = "Prefetch LoRAs (Fallback S3)"
+
+    def prefetch(self, lora_list):
+        items = []
+        names = []
+        for line in lora_list.splitlines():
+            parts = [part.strip() for part in line.split(',')]
+            if len(parts) != 3 or not all(parts):
+                continue
+            lora_name, bucket_name, object_key = parts
+            names.append(lora_name)
+            full_path, exists = get_full_path_simulate("loras", lora_name)
+            if not exists:
+                items.append((bucket_name, object_key, full_path))
+        results = get_loras_from_s3(items)
+        failed = [f"{bucket_name}/{object_key}"
+                  for (bucket_name, object_key, _), ok in zip(items, results) if not ok]
+        if failed:
+            raise FileNotFoundError(f"Failed to fetch LoRAs from S3: {', '.join(failed)}")
+        return ("\n".join(names),)
+
 validate(classes)
 CLASS_MAPPINGS, CLASS_NAMES = get_node_names_mappings(classes)